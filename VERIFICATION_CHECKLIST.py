@@ -7,14 +7,23 @@ Run this to ensure your nesting_cog_omega implementation is complete.
 """
 
 import os
+import sys
+import importlib
+import importlib.util
 from pathlib import Path
-import json
 
 
-def check_file_exists(path: str, description: str) -> tuple[bool, str]:
-    """Check if a file exists and return status."""
-    p = Path(path)
-    exists = p.exists()
+def list_directory(path: str) -> set:
+    """Return the names of all entries in a directory (empty set if missing)."""
+    if not os.path.isdir(path):
+        return set()
+    with os.scandir(path) as entries:
+        return {entry.name for entry in entries}
+
+
+def check_in(present: set, path: str, description: str) -> tuple[bool, str]:
+    """Check if a file is in a pre-scanned directory listing and return status."""
+    exists = os.path.basename(path) in present
     status = "✅ FOUND" if exists else "❌ MISSING"
     return exists, f"{status} - {path:<50} ({description})"
 
@@ -28,17 +37,23 @@ def check_directory_exists(path: str, description: str) -> tuple[bool, str]:
 
 
 def main():
-    print("\n" + "=" * 80)
-    print("nesting_cog_omega - VERIFICATION CHECKLIST")
-    print("=" * 80 + "\n")
+    # Collected and written in one go at the end rather than printed per check
+    out = []
+    out.append("\n" + "=" * 80)
+    out.append("nesting_cog_omega - VERIFICATION CHECKLIST")
+    out.append("=" * 80 + "\n")
     
     all_ok = True
     
+    # One directory scan per location instead of one stat per file
+    root_present = list_directory(".")
+    inbox_present = list_directory("00_INBOX")
+    
     # ========================================================================
     # CORE PYTHON MODULES
     # ========================================================================
-    print("📦 CORE PYTHON MODULES")
-    print("-" * 80)
+    out.append("📦 CORE PYTHON MODULES")
+    out.append("-" * 80)
     
     core_files = [
         ("nesting_cog_omega.py", "Main orchestrator"),
@@ -48,15 +63,15 @@ def main():
     ]
     
     for file_path, desc in core_files:
-        ok, msg = check_file_exists(file_path, desc)
-        print(msg)
+        ok, msg = check_in(root_present, file_path, desc)
+        out.append(msg)
         all_ok = all_ok and ok
     
     # ========================================================================
     # DOCUMENTATION
     # ========================================================================
-    print("\n📚 DOCUMENTATION FILES")
-    print("-" * 80)
+    out.append("\n📚 DOCUMENTATION FILES")
+    out.append("-" * 80)
     
     doc_files = [
         ("QUICKREF.md", "Quick reference guide"),
@@ -66,15 +81,15 @@ def main():
     ]
     
     for file_path, desc in doc_files:
-        ok, msg = check_file_exists(file_path, desc)
-        print(msg)
+        ok, msg = check_in(root_present, file_path, desc)
+        out.append(msg)
         all_ok = all_ok and ok
     
     # ========================================================================
     # STAGE 1 NOTES (INPUT DATA)
     # ========================================================================
-    print("\n📝 STAGE 1 NOTES (Input Data)")
-    print("-" * 80)
+    out.append("\n📝 STAGE 1 NOTES (Input Data)")
+    out.append("-" * 80)
     
     stage1_files = [
         ("00_INBOX/stage1_perplexity.md", "Perplexity notes"),
@@ -85,42 +100,35 @@ def main():
     ]
     
     for file_path, desc in stage1_files:
-        ok, msg = check_file_exists(file_path, desc)
-        print(msg)
+        ok, msg = check_in(inbox_present, file_path, desc)
+        out.append(msg)
         all_ok = all_ok and ok
     
     # ========================================================================
     # TEST IMPORTS
     # ========================================================================
-    print("\n🧪 MODULE IMPORT TEST")
-    print("-" * 80)
-    
-    try:
-        import cog_keys
-        print("✅ IMPORT OK - cog_keys module imports successfully")
-    except Exception as e:
-        print(f"❌ IMPORT FAILED - cog_keys: {e}")
-        all_ok = False
-    
-    try:
-        import cog_nexus
-        print("✅ IMPORT OK - cog_nexus module imports successfully")
-    except Exception as e:
-        print(f"❌ IMPORT FAILED - cog_nexus: {e}")
-        all_ok = False
-    
-    try:
-        import nesting_cog_omega
-        print("✅ IMPORT OK - nesting_cog_omega module imports successfully")
-    except Exception as e:
-        print(f"❌ IMPORT FAILED - nesting_cog_omega: {e}")
-        all_ok = False
+    out.append("\n🧪 MODULE IMPORT TEST")
+    out.append("-" * 80)
+    
+    # find_spec confirms each module is importable without executing it
+    for module_name in ["cog_keys", "cog_nexus", "nesting_cog_omega"]:
+        try:
+            spec = importlib.util.find_spec(module_name)
+        except Exception as e:
+            out.append(f"❌ IMPORT FAILED - {module_name}: {e}")
+            all_ok = False
+            continue
+        if spec is not None:
+            out.append(f"✅ IMPORT OK - {module_name} module is importable")
+        else:
+            out.append(f"❌ IMPORT FAILED - {module_name}: module not found")
+            all_ok = False
     
     # ========================================================================
     # FUNCTION AVAILABILITY TEST
     # ========================================================================
-    print("\n⚙️  FUNCTION AVAILABILITY TEST")
-    print("-" * 80)
+    out.append("\n⚙️  FUNCTION AVAILABILITY TEST")
+    out.append("-" * 80)
     
     functions_to_check = [
         ("cog_keys", ["get_api_keys", "get_api_key", "require_api_key", "key_is_available"]),
@@ -128,40 +136,45 @@ def main():
         ("nesting_cog_omega", ["run_stage2_synthesizer", "stage2_extract_unique_ideas", "stage3_build_master_plan"]),
     ]
     
+    modules = {}
     for module_name, functions in functions_to_check:
         try:
-            module = __import__(module_name)
-            for func_name in functions:
-                if hasattr(module, func_name):
-                    print(f"✅ FUNCTION OK - {module_name}.{func_name}()")
-                else:
-                    print(f"❌ MISSING - {module_name}.{func_name}()")
-                    all_ok = False
+            if module_name not in modules:
+                modules[module_name] = importlib.import_module(module_name)
+            # Look names up in the module dict directly: no descriptor protocol
+            # and no module-level __getattr__ lazy-load hooks
+            present = vars(modules[module_name]).keys()
+            missing = [f for f in functions if f not in present]
+            if missing:
+                out.append(f"❌ MISSING - {module_name}: {', '.join(f + '()' for f in missing)}")
+                all_ok = False
+            else:
+                out.append(f"✅ FUNCTION OK - {module_name}: all {len(functions)} functions present")
         except Exception as e:
-            print(f"❌ ERROR checking {module_name}: {e}")
+            out.append(f"❌ ERROR checking {module_name}: {e}")
             all_ok = False
     
     # ========================================================================
     # SUMMARY
     # ========================================================================
-    print("\n" + "=" * 80)
+    out.append("\n" + "=" * 80)
     if all_ok:
-        print("✅ VERIFICATION COMPLETE - All checks passed!")
-        print("\nYou're ready to run:")
-        print("  1. python test_orchestrator.py     (Run tests)")
-        print("  2. python nesting_cog_omega.py     (Run orchestrator)")
-        print("\nRead:")
-        print("  - QUICKREF.md for quick start")
-        print("  - ORCHESTRATOR_README.md for full docs")
+        out.append("✅ VERIFICATION COMPLETE - All checks passed!")
+        out.append("\nYou're ready to run:")
+        out.append("  1. python test_orchestrator.py     (Run tests)")
+        out.append("  2. python nesting_cog_omega.py     (Run orchestrator)")
+        out.append("\nRead:")
+        out.append("  - QUICKREF.md for quick start")
+        out.append("  - ORCHESTRATOR_README.md for full docs")
     else:
-        print("❌ VERIFICATION FAILED - Some checks did not pass")
-        print("\nPlease ensure all files are present before running.")
+        out.append("❌ VERIFICATION FAILED - Some checks did not pass")
+        out.append("\nPlease ensure all files are present before running.")
     
-    print("=" * 80 + "\n")
+    out.append("=" * 80 + "\n")
     
+    sys.stdout.write("\n".join(out) + "\n")
     return 0 if all_ok else 1
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
@@ -10,8 +10,14 @@
 
 import os
 import json
+import functools
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import ijson
+except ImportError:  # optional; validate_credentials_file falls back to json.load
+    ijson = None
 
 
 # =============================================================================
@@ -29,9 +35,22 @@ SUPPORTED_KEYS = {
     "google_credentials_json": "GOOGLE_CREDENTIALS_JSON",
 }
 
+# Process-wide snapshot of the key env vars; call refresh_env() after changing them
+_ENV_SNAPSHOT: Dict[str, Optional[str]] = {
+    env_var: os.environ.get(env_var) for env_var in SUPPORTED_KEYS.values()
+}
+
+# Frozen views of SUPPORTED_KEYS for the hot lookup paths
+_SUPPORTED_ITEMS = tuple(SUPPORTED_KEYS.items())
+_SUPPORTED_KEY_SET = frozenset(SUPPORTED_KEYS)
+
 # Optional: path to a JSON credentials file for batch loading
 CREDENTIALS_FILE_ENV = "COG_CREDENTIALS_FILE"
 CREDENTIALS_FILE_DEFAULT = Path.home() / ".cog" / "credentials.json"
+_DEFAULT_CRED_STR = os.fspath(CREDENTIALS_FILE_DEFAULT)
+
+# Last loaded credentials file as (path, mtime, contents); see _creds_dict()
+_CREDS_CACHE: Optional[Tuple[str, float, Dict[str, str]]] = None
 
 
 # =============================================================================
@@ -43,7 +62,7 @@ def get_api_keys() -> Dict[str, Optional[str]]:
     Load all available API keys from environment variables and optional config file.
     
     Precedence:
-    1. Environment variables (highest priority)
+    1. Environment variables (highest priority; snapshot, see refresh_env())
     2. Credentials file (if exists and readable)
     3. None (if not found)
     
@@ -56,21 +75,17 @@ def get_api_keys() -> Dict[str, Optional[str]]:
         }
     """
     keys = {}
+    file_keys = None
     
-    # Load from environment variables first
-    for key_name, env_var in SUPPORTED_KEYS.items():
-        keys[key_name] = os.getenv(env_var)
-    
-    # Attempt to load from credentials file for missing keys
-    creds_file = _get_credentials_file_path()
-    if creds_file and creds_file.exists():
-        try:
-            file_keys = _load_credentials_file(creds_file)
-            for key_name in SUPPORTED_KEYS:
-                if keys[key_name] is None and key_name in file_keys:
-                    keys[key_name] = file_keys[key_name]
-        except Exception:
-            pass  # Fail silently; env vars are primary source
+    # Environment variables first; the credentials file is only touched
+    # (and parsed at most once) if some key is missing from the environment.
+    for key_name, env_var in _SUPPORTED_ITEMS:
+        value = _ENV_SNAPSHOT.get(env_var)
+        if value is None:
+            if file_keys is None:
+                file_keys = _creds_dict()
+            value = file_keys.get(key_name)
+        keys[key_name] = value
     
     return keys
 
@@ -79,27 +94,25 @@ def get_api_key(key_name: str) -> Optional[str]:
     """
     Get a single API key by name.
     
+    A plain lookup in the env snapshot and the mtime-checked credentials
+    file cache, so edits to the credentials file are picked up; call
+    refresh_env() after changing environment variables.
+    
     Args:
         key_name: One of the keys from SUPPORTED_KEYS (e.g., "openai_api_key")
         
     Returns:
         The API key value, or None if not found.
     """
-    if key_name not in SUPPORTED_KEYS:
+    if key_name not in _SUPPORTED_KEY_SET:
         raise ValueError(f"Unknown key: {key_name}. Supported: {list(SUPPORTED_KEYS.keys())}")
     
     env_var = SUPPORTED_KEYS[key_name]
-    value = os.getenv(env_var)
+    value = _ENV_SNAPSHOT.get(env_var)
     
     if value is None:
         # Try credentials file
-        creds_file = _get_credentials_file_path()
-        if creds_file and creds_file.exists():
-            try:
-                file_keys = _load_credentials_file(creds_file)
-                value = file_keys.get(key_name)
-            except Exception:
-                pass
+        value = _creds_dict().get(key_name)
     
     return value
 
@@ -140,14 +153,49 @@ def key_is_available(key_name: str) -> bool:
     return get_api_key(key_name) is not None
 
 
+def reset_key_cache() -> None:
+    """
+    Clear the parsed credentials file so the next access re-reads it.
+    
+    Intended for tests and for long-running processes that rotate keys.
+    Environment changes additionally need refresh_env().
+    """
+    global _CREDS_CACHE
+    _CREDS_CACHE = None
+
+
+def refresh_env() -> None:
+    """
+    Re-read the key environment variables into the module snapshot.
+    
+    Useful in tests or from a SIGHUP handler after rotating keys in the env.
+    """
+    _ENV_SNAPSHOT.update({env_var: os.environ.get(env_var) for env_var in SUPPORTED_KEYS.values()})
+
+
+def reload() -> None:
+    """
+    Forget all cached state: the env snapshot, the resolved credentials file
+    path and the parsed credentials file. The next access re-reads env and file
+    from scratch.
+    """
+    refresh_env()
+    _reset_path_cache()
+    reset_key_cache()
+
+
 # =============================================================================
 # Private Helpers
 # =============================================================================
 
+@functools.lru_cache(maxsize=1)
 def _get_credentials_file_path() -> Optional[Path]:
     """
     Determine the path to the credentials file.
     
+    The result is cached for the life of the process; use reload() to pick up
+    a changed COG_CREDENTIALS_FILE or a newly created default file.
+    
     Returns:
         Path object, or None if no file is configured.
     """
@@ -157,16 +205,55 @@ def _get_credentials_file_path() -> Optional[Path]:
         return Path(explicit_path)
     
     # Use default if it exists
-    if CREDENTIALS_FILE_DEFAULT.exists():
+    if os.path.exists(_DEFAULT_CRED_STR):
         return CREDENTIALS_FILE_DEFAULT
     
     return None
 
 
+def _reset_path_cache() -> None:
+    _get_credentials_file_path.cache_clear()
+
+
+def _creds_dict() -> Dict[str, str]:
+    """
+    Return the credentials file contents, reloading only when its mtime changes.
+    
+    Returns:
+        Dict of key name to value, or an empty dict if no file is configured
+        or it cannot be read or parsed.
+    """
+    global _CREDS_CACHE
+    creds_file = _get_credentials_file_path()
+    if creds_file is None:
+        return {}
+    
+    path_str = str(creds_file)
+    try:
+        mtime = os.stat(path_str).st_mtime
+    except OSError:
+        return {}
+    
+    cached = _CREDS_CACHE
+    if cached is not None and cached[0] == path_str and cached[1] == mtime:
+        return cached[2]
+    
+    try:
+        data = _load_credentials_file(creds_file)
+    except Exception:
+        data = {}  # Fail silently; env vars are primary source
+    
+    _CREDS_CACHE = (path_str, mtime, data)
+    return data
+
+
 def _load_credentials_file(path: Path) -> Dict[str, str]:
     """
     Load credentials from a JSON file.
     
+    Not memoized: _creds_dict() keeps only the current version of the file
+    (keyed on path and mtime), so rotated-out secrets are not kept alive.
+    
     Expected format:
     {
         "openai_api_key": "sk-...",
@@ -183,7 +270,7 @@ def _load_credentials_file(path: Path) -> Dict[str, str]:
     Raises:
         Exception: If file cannot be read or parsed
     """
-    with path.open("r", encoding="utf-8") as f:
+    with open(path, "r", encoding="utf-8") as f:
         data = json.load(f)
     
     if not isinstance(data, dict):
@@ -196,18 +283,50 @@ def validate_credentials_file(path: Path) -> bool:
     """
     Validate that a credentials file is properly formatted.
     
+    When ijson is installed, the file is streamed and only its top-level key
+    names are inspected: validation stops at the first unknown key and the
+    secret values are never collected into memory. Without ijson, the whole
+    file is parsed with the stdlib json module.
+    
     Args:
         path: Path to the credentials file to validate
         
     Returns:
         True if valid, False otherwise
     """
+    if ijson is not None:
+        return _validate_credentials_stream(path)
+    
     try:
         data = _load_credentials_file(path)
         # Check that all keys in the file are known keys
         for key in data:
-            if key not in SUPPORTED_KEYS:
+            if key not in _SUPPORTED_KEY_SET:
+                return False
+        return True
+    except Exception:
+        return False
+
+
+def _validate_credentials_stream(path: Path) -> bool:
+    """
+    Validate a credentials file by streaming its top-level keys with ijson.
+    
+    Args:
+        path: Path to the credentials file to validate
+        
+    Returns:
+        True if the file is a JSON object with only supported keys
+    """
+    try:
+        with open(path, "rb") as f:
+            events = ijson.parse(f)
+            _, event, _ = next(events)
+            if event != "start_map":
                 return False
+            for prefix, event, value in events:
+                if prefix == "" and event == "map_key" and value not in _SUPPORTED_KEY_SET:
+                    return False
         return True
     except Exception:
         return False
@@ -224,7 +343,7 @@ def list_available_keys() -> Dict[str, bool]:
     Returns:
         Dict mapping key name to availability (True/False)
     """
-    return {key_name: key_is_available(key_name) for key_name in SUPPORTED_KEYS}
+    return {key_name: value is not None for key_name, value in get_api_keys().items()}
 
 
 def get_summary() -> Dict[str, Any]:
@@ -241,6 +360,7 @@ def get_summary() -> Dict[str, Any]:
         }
     """
     all_keys = list_available_keys()
+    path = _get_credentials_file_path()
     available = [k for k, v in all_keys.items() if v]
     missing = [k for k, v in all_keys.items() if not v]
     
@@ -249,7 +369,7 @@ def get_summary() -> Dict[str, Any]:
         "missing_keys": missing,
         "total": len(SUPPORTED_KEYS),
         "available_count": len(available),
-        "credentials_file": str(_get_credentials_file_path()) if _get_credentials_file_path() else None,
+        "credentials_file": str(path) if path else None,
     }
 
 
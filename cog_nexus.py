@@ -10,16 +10,28 @@
 # - run_coder: Code generation agent
 # - run_reviewer: Review and validation agent
 # - run_tools: Tool execution wrapper
+#
+# Each run_* runner has an async counterpart (arun_*), and batch_run_agents
+# has abatch_run_agents, for callers that already live on an event loop.
 
+import asyncio
 import json
-import uuid
 import datetime
+import itertools
+import linecache
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Optional
-from enum import Enum
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
 
 
-class AgentType(Enum):
-    """Types of agents available in the pipeline."""
+class AgentType:
+    """Types of agents available in the pipeline (plain string constants)."""
     AGENT = "agent"
     RESEARCH = "research"
     ANALYZER = "analyzer"
@@ -28,13 +40,47 @@ class AgentType(Enum):
     REVIEWER = "reviewer"
 
 
+# Per-agent (temperature, max_tokens) defaults
+_AGENT_DEFAULTS = {
+    AgentType.AGENT: (0.7, 2000),
+    AgentType.RESEARCH: (0.3, 3000),
+    AgentType.ANALYZER: (0.1, 2000),
+    AgentType.PLANNER: (0.15, 2400),
+    AgentType.CODER: (0.2, 3000),
+    AgentType.REVIEWER: (0.0, 800),
+}
+
+
+def iso(ns: int) -> str:
+    """
+    Format a response timestamp (nanoseconds since the epoch) as ISO 8601 UTC.
+    
+    Responses store the raw time.time_ns() value; call this only when a
+    human-readable string is actually needed.
+    """
+    return datetime.datetime.fromtimestamp(ns / 1e9, tz=datetime.timezone.utc).isoformat()
+
+
+def _dumps_compact(obj: Any) -> str:
+    """Internal: Serialize obj to compact JSON text, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+# Identifies the model backend behind _call_model. Update it when wiring in a
+# real provider/model: callers that cache responses (nesting_cog_omega's
+# _meta/_cache) key on it, so older backends' responses are not replayed.
+MODEL_BACKEND = "placeholder-model"
+
+
 # Placeholder for actual model calls - replace with real LLM integration
 def _call_model(
-    agent_type: AgentType,
+    agent_type: str,
     task_id: str,
     instructions: str,
-    temperature: float = 0.7,
-    max_tokens: int = 2000,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Internal: Call the appropriate model backend for an agent task.
@@ -46,208 +92,271 @@ def _call_model(
     4. Log interactions
     
     Args:
-        agent_type: Type of agent making the call
+        agent_type: Type of agent making the call (an AgentType constant)
         task_id: Unique identifier for this task (e.g., "handoff-2-task-1")
         instructions: Prompt/instructions for the model
-        temperature: Sampling temperature (0.0 = deterministic, 1.0 = creative)
-        max_tokens: Maximum tokens in response
+        temperature: Sampling temperature (0.0 = deterministic, 1.0 = creative);
+            None uses the agent type's default
+        max_tokens: Maximum tokens in response; None uses the agent type's default
         
     Returns:
-        Dict with keys: text, tokens, model, timestamp
+        Dict with keys: text, tokens, model, timestamp (ns since epoch; see iso())
     """
+    if temperature is None or max_tokens is None:
+        default_temperature, default_max_tokens = _AGENT_DEFAULTS.get(
+            agent_type, _AGENT_DEFAULTS[AgentType.AGENT]
+        )
+        if temperature is None:
+            temperature = default_temperature
+        if max_tokens is None:
+            max_tokens = default_max_tokens
+    
     # Placeholder response - in production, this would call the actual LLM
-    response_text = json.dumps({
+    response_text = _dumps_compact({
         "status": "placeholder",
-        "message": f"Placeholder response for {agent_type.value} agent",
+        "message": f"Placeholder response for {agent_type} agent",
         "task_id": task_id,
-        "agent_type": agent_type.value,
+        "agent_type": agent_type,
         "instructions_length": len(instructions),
-    }, indent=2)
+    })
+    
+    # Rough whitespace-based token estimates; str.count avoids building a list
+    prompt_tokens = instructions.count(" ") + 1 if instructions else 0
+    completion_tokens = response_text.count(" ") + 1 if response_text else 0
     
     return {
         "text": response_text,
         "tokens": {
-            "prompt": len(instructions.split()),
-            "completion": len(response_text.split()),
+            "prompt": prompt_tokens,
+            "completion": completion_tokens,
         },
-        "model": "placeholder-model",
-        "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
+        "model": MODEL_BACKEND,
+        "timestamp": time.time_ns(),
         "task_id": task_id,
     }
 
 
+async def _acall_model(
+    agent_type: str,
+    task_id: str,
+    instructions: str,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Internal: Async counterpart of _call_model with the same return contract.
+    
+    Until a native async backend exists, the blocking _call_model runs in a
+    worker thread, so a real (blocking) HTTP call swapped into _call_model
+    does not stall the event loop or serialize concurrent arun_* calls. A
+    shared async HTTP client (e.g., httpx.AsyncClient) can replace this body
+    later without one thread per call.
+    
+    Returns:
+        Dict with keys: text, tokens, model, timestamp
+    """
+    return await asyncio.to_thread(_call_model, agent_type, task_id, instructions, temperature, max_tokens)
+
+
 # =============================================================================
 # Public Agent Runners
 # =============================================================================
+#
+# The run_* runners differ only in their agent type and default temperature /
+# max_tokens, so they are generated from _RUNNER_SPECS (the same technique as
+# dataclasses' generated __init__): the agent type and defaults are compiled
+# in as literal constants. Every runner has the signature
+#
+#     run_xxx(task_id, instructions, temperature=<default>, max_tokens=<default>) -> dict
+
+_RUNNER_TEMPLATE = (
+    "def {name}(task_id: str, instructions: str, "
+    "temperature: float = {temperature!r}, max_tokens: int = {max_tokens!r}) -> Dict[str, Any]:\n"
+    '    """\n'
+    "{doc}"
+    '    """\n'
+    "    return _call_model({agent_type!r}, task_id, instructions, temperature, max_tokens)\n"
+)
 
-def run_agent(
+# (function name, agent type, docstring)
+_RUNNER_SPECS = (
+    ("run_agent", AgentType.AGENT,
+     "Run a general-purpose agent.\n"
+     "\n"
+     "Args:\n"
+     '    task_id: Unique identifier (e.g., "handoff-2-task-1")\n'
+     "    instructions: Prompt for the agent\n"
+     "    temperature: Sampling temperature\n"
+     "    max_tokens: Maximum tokens in response\n"
+     "\n"
+     "Returns:\n"
+     "    Response dict with text, tokens, model, timestamp"),
+    ("run_research", AgentType.RESEARCH,
+     "Run a research agent (lower temperature for consistency).\n"
+     "\n"
+     "Args:\n"
+     "    task_id: Unique identifier\n"
+     "    instructions: Research prompt\n"
+     "    temperature: Sampling temperature (default 0.3 for deterministic output)\n"
+     "    max_tokens: Maximum tokens in response\n"
+     "\n"
+     "Returns:\n"
+     "    Response dict with text, tokens, model, timestamp"),
+    ("run_analyzer", AgentType.ANALYZER,
+     "Run an analyzer agent (very low temperature for precise extraction).\n"
+     "\n"
+     "Used in Stage 2 to extract unique ideas and deduplicate content.\n"
+     "\n"
+     "Args:\n"
+     "    task_id: Unique identifier\n"
+     "    instructions: Analysis prompt (should request structured output)\n"
+     "    temperature: Sampling temperature (default 0.1 for high precision)\n"
+     "    max_tokens: Maximum tokens in response\n"
+     "\n"
+     "Returns:\n"
+     "    Response dict with text (typically JSON), tokens, model, timestamp"),
+    ("run_planner", AgentType.PLANNER,
+     "Run a planner agent (low temperature for coherent planning).\n"
+     "\n"
+     "Used in Stage 3 to synthesize a master plan from deduplicated ideas.\n"
+     "\n"
+     "Args:\n"
+     "    task_id: Unique identifier\n"
+     "    instructions: Planning prompt (should request structured output)\n"
+     "    temperature: Sampling temperature (default 0.15 for consistency)\n"
+     "    max_tokens: Maximum tokens in response\n"
+     "\n"
+     "Returns:\n"
+     "    Response dict with text (typically JSON), tokens, model, timestamp"),
+    ("run_coder", AgentType.CODER,
+     "Run a code generation agent (low temperature for correctness).\n"
+     "\n"
+     "Args:\n"
+     "    task_id: Unique identifier\n"
+     "    instructions: Code generation prompt\n"
+     "    temperature: Sampling temperature (default 0.2 for reliability)\n"
+     "    max_tokens: Maximum tokens in response\n"
+     "\n"
+     "Returns:\n"
+     "    Response dict with text (code), tokens, model, timestamp"),
+    ("run_reviewer", AgentType.REVIEWER,
+     "Run a reviewer agent (zero temperature for deterministic evaluation).\n"
+     "\n"
+     "Used in Stage 6 to review and validate the master plan and tasks.\n"
+     "\n"
+     "Args:\n"
+     "    task_id: Unique identifier\n"
+     "    instructions: Review prompt with checklist or criteria\n"
+     "    temperature: Sampling temperature (default 0.0 for deterministic)\n"
+     "    max_tokens: Maximum tokens in response\n"
+     "\n"
+     "Returns:\n"
+     "    Response dict with text (typically JSON review), tokens, model, timestamp"),
+)
+
+
+def _make_runner(name: str, agent_type: str, doc: str):
+    """
+    Internal: Compile a run_* function with its agent type and defaults inlined.
+    
+    The function is exec'd against this module's globals, so _call_model is
+    looked up at call time (patching or replacing cog_nexus._call_model
+    reaches every runner). Its source is registered with linecache so
+    inspect.getsource() and tracebacks can show it.
+    """
+    temperature, max_tokens = _AGENT_DEFAULTS[agent_type]
+    source = _RUNNER_TEMPLATE.format(
+        name=name,
+        agent_type=agent_type,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        doc="".join(f"    {line}\n" if line.strip() else "    \n" for line in doc.splitlines()),
+    )
+    filename = f"<cog_nexus generated {name}>"
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, filename, "exec"), globals(), namespace)
+    return namespace[name]
+
+
+RUNNERS = {agent_type: _make_runner(name, agent_type, doc) for name, agent_type, doc in _RUNNER_SPECS}
+
+run_agent = RUNNERS[AgentType.AGENT]
+run_research = RUNNERS[AgentType.RESEARCH]
+run_analyzer = RUNNERS[AgentType.ANALYZER]
+run_planner = RUNNERS[AgentType.PLANNER]
+run_coder = RUNNERS[AgentType.CODER]
+run_reviewer = RUNNERS[AgentType.REVIEWER]
+
+
+# =============================================================================
+# Async Agent Runners
+# =============================================================================
+
+async def arun_agent(
     task_id: str,
     instructions: str,
     temperature: float = 0.7,
     max_tokens: int = 2000,
 ) -> Dict[str, Any]:
-    """
-    Run a general-purpose agent.
-    
-    Args:
-        task_id: Unique identifier (e.g., "handoff-2-task-1")
-        instructions: Prompt for the agent
-        temperature: Sampling temperature
-        max_tokens: Maximum tokens in response
-        
-    Returns:
-        Response dict with text, tokens, model, timestamp
-    """
-    return _call_model(
-        AgentType.AGENT,
-        task_id,
-        instructions,
-        temperature,
-        max_tokens,
-    )
+    """Async variant of run_agent."""
+    return await _acall_model(AgentType.AGENT, task_id, instructions, temperature, max_tokens)
 
 
-def run_research(
+async def arun_research(
     task_id: str,
     instructions: str,
     temperature: float = 0.3,
     max_tokens: int = 3000,
 ) -> Dict[str, Any]:
-    """
-    Run a research agent (lower temperature for consistency).
-    
-    Args:
-        task_id: Unique identifier
-        instructions: Research prompt
-        temperature: Sampling temperature (default 0.3 for deterministic output)
-        max_tokens: Maximum tokens in response
-        
-    Returns:
-        Response dict with text, tokens, model, timestamp
-    """
-    return _call_model(
-        AgentType.RESEARCH,
-        task_id,
-        instructions,
-        temperature,
-        max_tokens,
-    )
+    """Async variant of run_research."""
+    return await _acall_model(AgentType.RESEARCH, task_id, instructions, temperature, max_tokens)
 
 
-def run_analyzer(
+async def arun_analyzer(
     task_id: str,
     instructions: str,
     temperature: float = 0.1,
     max_tokens: int = 2000,
 ) -> Dict[str, Any]:
-    """
-    Run an analyzer agent (very low temperature for precise extraction).
-    
-    Used in Stage 2 to extract unique ideas and deduplicate content.
-    
-    Args:
-        task_id: Unique identifier
-        instructions: Analysis prompt (should request structured output)
-        temperature: Sampling temperature (default 0.1 for high precision)
-        max_tokens: Maximum tokens in response
-        
-    Returns:
-        Response dict with text (typically JSON), tokens, model, timestamp
-    """
-    return _call_model(
-        AgentType.ANALYZER,
-        task_id,
-        instructions,
-        temperature,
-        max_tokens,
-    )
+    """Async variant of run_analyzer."""
+    return await _acall_model(AgentType.ANALYZER, task_id, instructions, temperature, max_tokens)
 
 
-def run_planner(
+async def arun_planner(
     task_id: str,
     instructions: str,
     temperature: float = 0.15,
     max_tokens: int = 2400,
 ) -> Dict[str, Any]:
-    """
-    Run a planner agent (low temperature for coherent planning).
-    
-    Used in Stage 3 to synthesize a master plan from deduplicated ideas.
-    
-    Args:
-        task_id: Unique identifier
-        instructions: Planning prompt (should request structured output)
-        temperature: Sampling temperature (default 0.15 for consistency)
-        max_tokens: Maximum tokens in response
-        
-    Returns:
-        Response dict with text (typically JSON), tokens, model, timestamp
-    """
-    return _call_model(
-        AgentType.PLANNER,
-        task_id,
-        instructions,
-        temperature,
-        max_tokens,
-    )
+    """Async variant of run_planner."""
+    return await _acall_model(AgentType.PLANNER, task_id, instructions, temperature, max_tokens)
 
 
-def run_coder(
+async def arun_coder(
     task_id: str,
     instructions: str,
     temperature: float = 0.2,
     max_tokens: int = 3000,
 ) -> Dict[str, Any]:
-    """
-    Run a code generation agent (low temperature for correctness).
-    
-    Args:
-        task_id: Unique identifier
-        instructions: Code generation prompt
-        temperature: Sampling temperature (default 0.2 for reliability)
-        max_tokens: Maximum tokens in response
-        
-    Returns:
-        Response dict with text (code), tokens, model, timestamp
-    """
-    return _call_model(
-        AgentType.CODER,
-        task_id,
-        instructions,
-        temperature,
-        max_tokens,
-    )
+    """Async variant of run_coder."""
+    return await _acall_model(AgentType.CODER, task_id, instructions, temperature, max_tokens)
 
 
-def run_reviewer(
+async def arun_reviewer(
     task_id: str,
     instructions: str,
     temperature: float = 0.0,
     max_tokens: int = 800,
 ) -> Dict[str, Any]:
-    """
-    Run a reviewer agent (zero temperature for deterministic evaluation).
-    
-    Used in Stage 6 to review and validate the master plan and tasks.
-    
-    Args:
-        task_id: Unique identifier
-        instructions: Review prompt with checklist or criteria
-        temperature: Sampling temperature (default 0.0 for deterministic)
-        max_tokens: Maximum tokens in response
-        
-    Returns:
-        Response dict with text (typically JSON review), tokens, model, timestamp
-    """
-    return _call_model(
-        AgentType.REVIEWER,
-        task_id,
-        instructions,
-        temperature,
-        max_tokens,
-    )
+    """Async variant of run_reviewer."""
+    return await _acall_model(AgentType.REVIEWER, task_id, instructions, temperature, max_tokens)
 
 
+# =============================================================================
+# Tools
+# =============================================================================
+
 def run_tools(
     task_id: str,
     tool_name: str,
@@ -271,7 +380,7 @@ def run_tools(
         "tool": tool_name,
         "args": tool_args,
         "result": "Tool execution completed (placeholder)",
-        "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
+        "timestamp": time.time_ns(),
     }
 
 
@@ -279,12 +388,72 @@ def run_tools(
 # Utilities
 # =============================================================================
 
+# Fallback task ids for batch configs without one: cheap, unique per process, sortable
+_task_counter = itertools.count(1)
+
+# Async counterpart of RUNNERS, used by abatch_run_agents
+_ADISPATCH = {
+    AgentType.AGENT: arun_agent,
+    AgentType.RESEARCH: arun_research,
+    AgentType.ANALYZER: arun_analyzer,
+    AgentType.PLANNER: arun_planner,
+    AgentType.CODER: arun_coder,
+    AgentType.REVIEWER: arun_reviewer,
+}
+
+
+def _unpack_config(config: Dict[str, Any]) -> tuple:
+    """
+    Internal: Apply batch defaults to one agent config.
+    
+    Returns:
+        Tuple of (agent_type, task_id, instructions, temperature, max_tokens)
+    """
+    task_id = config.get("task_id")
+    if task_id is None:
+        task_id = f"task-{next(_task_counter):08x}"
+    return (
+        config.get("agent_type", AgentType.AGENT),
+        task_id,
+        config.get("instructions", ""),
+        config.get("temperature", 0.7),
+        config.get("max_tokens", 2000),
+    )
+
+
+def _dispatch(
+    config: Dict[str, Any],
+    semaphore: Optional[threading.BoundedSemaphore] = None,
+) -> Dict[str, Any]:
+    """
+    Internal: Run a single batch_run_agents config through its runner.
+    
+    Args:
+        config: One entry of the agent_configs list
+        semaphore: Optional semaphore held for the duration of the model call
+        
+    Returns:
+        Response dict from the selected runner
+    """
+    agent_type, task_id, instructions, temperature, max_tokens = _unpack_config(config)
+    
+    runner = RUNNERS.get(agent_type, run_agent)
+    if semaphore is None:
+        return runner(task_id, instructions, temperature, max_tokens)
+    with semaphore:
+        return runner(task_id, instructions, temperature, max_tokens)
+
+
 def batch_run_agents(
     agent_configs: list,
+    max_workers: Optional[int] = None,
+    semaphore: Optional[threading.BoundedSemaphore] = None,
 ) -> list:
     """
-    Run multiple agents in parallel (conceptually; actual parallelization
-    depends on backend implementation).
+    Run multiple agents in parallel on a thread pool.
+    
+    Model calls are I/O-bound, so overlapping them in threads brings the
+    wall-clock time of a batch close to that of its slowest call.
     
     Args:
         agent_configs: List of dicts with keys:
@@ -293,34 +462,49 @@ def batch_run_agents(
             - instructions: Prompt
             - temperature: Optional sampling temperature
             - max_tokens: Optional max tokens
+        max_workers: Thread pool size (default min(32, len(agent_configs)))
+        semaphore: Optional semaphore to cap in-flight calls below the pool
+            size, e.g. to respect provider rate limits
             
     Returns:
-        List of response dicts
+        List of response dicts, in the same order as agent_configs
     """
-    results = []
-    for config in agent_configs:
-        agent_type = config.get("agent_type", "agent")
-        task_id = config.get("task_id", f"task-{uuid.uuid4().hex[:8]}")
-        instructions = config.get("instructions", "")
-        temperature = config.get("temperature", 0.7)
-        max_tokens = config.get("max_tokens", 2000)
-        
-        if agent_type == "research":
-            result = run_research(task_id, instructions, temperature, max_tokens)
-        elif agent_type == "analyzer":
-            result = run_analyzer(task_id, instructions, temperature, max_tokens)
-        elif agent_type == "planner":
-            result = run_planner(task_id, instructions, temperature, max_tokens)
-        elif agent_type == "coder":
-            result = run_coder(task_id, instructions, temperature, max_tokens)
-        elif agent_type == "reviewer":
-            result = run_reviewer(task_id, instructions, temperature, max_tokens)
-        else:
-            result = run_agent(task_id, instructions, temperature, max_tokens)
+    if not agent_configs:
+        return []
+    
+    if max_workers is None:
+        max_workers = min(32, len(agent_configs))
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda config: _dispatch(config, semaphore), agent_configs))
+
+
+async def abatch_run_agents(
+    agent_configs: list,
+    max_concurrency: int = 32,
+) -> list:
+    """
+    Async variant of batch_run_agents using asyncio.gather.
+    
+    All calls share the caller's event loop; a semaphore caps how many are
+    in flight at once.
+    
+    Args:
+        agent_configs: List of dicts, same format as batch_run_agents
+        max_concurrency: Maximum number of concurrent model calls
         
-        results.append(result)
+    Returns:
+        List of response dicts, in the same order as agent_configs
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def _run(config: Dict[str, Any]) -> Dict[str, Any]:
+        agent_type, task_id, instructions, temperature, max_tokens = _unpack_config(config)
+        runner = _ADISPATCH.get(agent_type, arun_agent)
+        async with semaphore:
+            return await runner(task_id, instructions, temperature, max_tokens)
     
-    return results
+    return list(await asyncio.gather(*[_run(config) for config in agent_configs]))
 
 
 if __name__ == "__main__":
@@ -5,67 +5,99 @@ This is intentionally simple — replace mock implementations with real ones as
 """
 
 import os
-from typing import Any, Dict
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 
 class BasePlugin:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
 
+    @cached_property
     def available(self) -> bool:
+        # Evaluated once per plugin instance; subclasses implement _check_available()
+        return self._check_available()
+
+    def _check_available(self) -> bool:
         raise NotImplementedError
 
     def run(self, *args, **kwargs):
         raise NotImplementedError
 
 
+PLUGIN_REGISTRY: Dict[str, Type[BasePlugin]] = {}
+
+
+def register_plugin(name: str):
+    """Class decorator that adds a plugin to PLUGIN_REGISTRY under `name`."""
+    def decorator(cls: Type[BasePlugin]) -> Type[BasePlugin]:
+        PLUGIN_REGISTRY[name] = cls
+        return cls
+    return decorator
+
+
+@register_plugin("github")
 class GitHubPlugin(BasePlugin):
-    def available(self) -> bool:
+    def _check_available(self) -> bool:
         return bool(os.getenv("GITHUB_TOKEN"))
 
     def run(self, action: str, **kwargs):
-        if not self.available():
+        if not self.available:
             return {"mode": "mock", "action": action, "result": "mocked github response"}
         # Real implementation would call GitHub REST API here
         return {"mode": "real", "action": action, "result": "call to GitHub API"}
 
 
+@register_plugin("langchain")
 class LangChainBridgePlugin(BasePlugin):
-    def available(self) -> bool:
+    def _check_available(self) -> bool:
         # Example: check for LANGCHAIN api key or dependency
         return bool(os.getenv("LANGCHAIN_KEY"))
 
     def run(self, query: str, **kwargs):
-        if not self.available():
+        if not self.available:
             return {"mode": "mock", "query": query, "result": "mocked retrieval"}
         return {"mode": "real", "query": query, "result": "real RAG response"}
 
 
+@register_plugin("google")
 class GoogleWorkspacePlugin(BasePlugin):
-    def available(self) -> bool:
+    def _check_available(self) -> bool:
         return bool(os.getenv("GOOGLE_CREDENTIALS_JSON"))
 
     def run(self, title: str, content: str, **kwargs):
-        if not self.available():
+        if not self.available:
             return {"mode": "mock", "title": title, "result": "mocked google doc created"}
         return {"mode": "real", "title": title, "result": "real google doc created"}
 
 
-def main():
-    config = {}
-    github = GitHubPlugin(config)
-    langchain = LangChainBridgePlugin(config)
-    google = GoogleWorkspacePlugin(config)
+def run_all(requests: List[Tuple[str, Dict[str, Any]]], config: Optional[Dict[str, Any]] = None) -> list:
+    """
+    Dispatch (plugin_name, kwargs) requests through PLUGIN_REGISTRY.
+    Each plugin is instantiated at most once, so its availability check runs once.
+    """
+    config = {} if config is None else config
+    instances: Dict[str, BasePlugin] = {}
+    results = []
+    for name, kwargs in requests:
+        plugin = instances.get(name)
+        if plugin is None:
+            plugin = instances[name] = PLUGIN_REGISTRY[name](config)
+        results.append(plugin.run(**kwargs))
+    return results
 
+
+def main():
     print("Starting Semantic Kernel Multi-Tool Demo...\n")
 
-    gh_res = github.run("list_issues")
-    print("GitHub plugin:", gh_res)
+    gh_res, lc_res, gdoc_res = run_all([
+        ("github", {"action": "list_issues"}),
+        ("langchain", {"query": "Explain Semantic Kernel pattern"}),
+        ("google", {"title": "Demo Doc", "content": "This doc was created by the demo."}),
+    ])
 
-    lc_res = langchain.run("Explain Semantic Kernel pattern")
+    print("GitHub plugin:", gh_res)
     print("LangChainBridge plugin:", lc_res)
-
-    gdoc_res = google.run("Demo Doc", "This doc was created by the demo.")
     print("Google Workspace plugin:", gdoc_res)
 
     print("\nDemo finished. Replace mocks with real implementations and add tests/workflows as needed.")
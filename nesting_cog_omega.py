@@ -2,23 +2,29 @@
 # nesting_cog_omega.py
 # Stage 2 synthesizer and orchestrator
 
+import io
 import os
+import re
 import json
+import time
 import uuid
+import queue
+import atexit
+import asyncio
+import hashlib
 import datetime
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from cog_nexus import (
-    run_agent,
-    run_research,
-    run_analyzer,
-    run_planner,
-    run_coder,
-    run_reviewer,
-    run_tools,
-)
 from cog_keys import get_api_keys
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
 
 # -----------------------------------------------------------------------------
 # Paths and constants
@@ -29,9 +35,20 @@ INBOX_DIR = BASE_DIR / "00_INBOX"
 PROJECT_ROOT = BASE_DIR / "projects" / "current_project"
 LOG_DIR = PROJECT_ROOT / "_logs"
 META_DIR = PROJECT_ROOT / "_meta"
+LLM_CACHE_DIR = META_DIR / "_cache"
 
 STAGE2_HANDOFF_PATH = PROJECT_ROOT / "stage2_handoff.json"
 
+# Artifact table recorded in stage2_handoff.json, resolved once at import
+_ARTIFACT_PATHS = {
+    "unique_ideas": str(PROJECT_ROOT / "stage2_unique_ideas.json"),
+    "master_plan_json": str(PROJECT_ROOT / "stage3_master_plan.json"),
+    "master_plan_md": str(PROJECT_ROOT / "stage3_master_plan.md"),
+    "tasks_json": str(PROJECT_ROOT / "stage4_tasks.json"),
+    "monitor_json": str(META_DIR / "monitor_summary.json"),
+    "clean_report_json": str(META_DIR / "clean_report.json"),
+}
+
 INBOX_DIR.mkdir(parents=True, exist_ok=True)
 PROJECT_ROOT.mkdir(parents=True, exist_ok=True)
 LOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -46,23 +63,40 @@ def _now_iso() -> str:
     return datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
 
 
+def _dumps(data) -> bytes:
+    # Indented UTF-8 JSON; orjson when available, same layout as json.dump(indent=2)
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def _load_json(path: Path, default=None):
     if not path.exists():
         return default
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return _loads(path.read_bytes())
 
 
 def _save_json(path: Path, data) -> None:
+    # Write to a sibling temp file and os.replace it into place, so readers
+    # (agent_clean, agent_pack, downstream systems) never see a partial file
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(_dumps(data))
+    os.replace(tmp, path)
 
 
 def _write_text(path: Path, content: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
         f.write(content)
+    os.replace(tmp, path)
 
 
 def _read_text(path: Path, default: str = "") -> str:
@@ -72,22 +106,164 @@ def _read_text(path: Path, default: str = "") -> str:
         return f.read()
 
 
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL | re.IGNORECASE)
+
+
+_JSON_OBJECT_START_RE = re.compile(r'\{\s*(?:"|$)')
+
+
+def _balanced_objects(text: str):
+    """
+    Yield each top-level brace-balanced {...} substring of text, left to right
+    (braces inside JSON strings are ignored), in a single linear pass.
+
+    Objects nested inside a candidate that closed are never yielded on their
+    own, and neither are those inside a candidate that is still open at end
+    of text but starts like a JSON object (output cut off at max_tokens).
+    A stray "{" in prose that never closes is skipped instead, so objects
+    after it are still found.
+    """
+    # Each open brace: [start index, closed direct children as (start, end)]
+    stack = []
+    in_string = False
+    escaped = False
+    i = text.find("{")
+    while i != -1 and i < len(text):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            stack.append([i, []])
+        elif ch == "}":
+            start, _ = stack.pop()
+            if not stack:
+                yield text[start:i + 1]
+                i = text.find("{", i + 1)
+                continue
+            stack[-1][1].append((start, i))
+        i += 1
+
+    # Unclosed braces at end of text, outermost first: stray prose braces are
+    # dropped (their closed children become top-level candidates) until one
+    # that looks like truncated JSON, which rejects everything inside it.
+    spans = []
+    for start, children in stack:
+        if _JSON_OBJECT_START_RE.match(text, start):
+            break
+        spans.extend(children)
+    for start, end in sorted(spans):
+        yield text[start:end + 1]
+
+
+def _parse_llm_json(text: str) -> dict:
+    """
+    Parse the JSON object in an LLM response.
+
+    Fast path: the whole text is JSON. Otherwise strip ```json fences, then
+    fall back to the first top-level brace-balanced {...} in the text that
+    parses (LLMs often wrap JSON in prose). Raises ValueError if no JSON
+    object can be recovered, including for truncated output; a nested
+    fragment is never returned in place of the whole response.
+    """
+    try:
+        data = _loads(text)
+    except ValueError:
+        data = None
+    else:
+        if isinstance(data, dict):
+            return data
+        raise ValueError("LLM response JSON is not an object")
+
+    fence = _JSON_FENCE_RE.search(text)
+    if fence:
+        try:
+            data = _loads(fence.group(1))
+        except ValueError:
+            data = None
+        if isinstance(data, dict):
+            return data
+
+    for candidate in _balanced_objects(text):
+        try:
+            data = _loads(candidate)
+        except ValueError:
+            continue
+        if isinstance(data, dict):
+            return data
+
+    raise ValueError("No JSON object found in LLM response")
+
+
+# What a malformed or missing LLM response can raise: ValueError from
+# _parse_llm_json (orjson.JSONDecodeError subclasses it), TypeError/KeyError
+# from a response without usable "text". Anything else is a real bug.
+_LLM_PARSE_ERRORS = (ValueError, TypeError, KeyError)
+
+
 def _new_task_id(stage: int, seq: int) -> str:
     # dash-number tracking: handoff-<stage>-task-<n>
     return f"handoff-{stage}-task-{seq}"
 
 
+# Event logs are written by a single background thread so the file I/O
+# overlaps with model calls instead of blocking the pipeline.
+_LOG_QUEUE: "queue.Queue[tuple]" = queue.Queue()
+_LOG_WRITER = None
+_LOG_WRITER_LOCK = threading.Lock()
+
+
+def _log_writer_loop() -> None:
+    while True:
+        path, record = _LOG_QUEUE.get()
+        try:
+            _save_json(path, record)
+        except Exception:
+            pass  # logs are best-effort side effects
+        finally:
+            _LOG_QUEUE.task_done()
+
+
+def _ensure_log_writer() -> None:
+    global _LOG_WRITER
+    if _LOG_WRITER is not None:
+        return
+    with _LOG_WRITER_LOCK:
+        if _LOG_WRITER is None:
+            _LOG_WRITER = threading.Thread(target=_log_writer_loop, name="cog-log-writer", daemon=True)
+            _LOG_WRITER.start()
+
+
+def _flush_log_events() -> None:
+    # Block until every queued event has been written
+    if _LOG_WRITER is not None:
+        _LOG_QUEUE.join()
+
+
+atexit.register(_flush_log_events)
+
+
 def _log_event(kind: str, payload: dict) -> None:
-    stamp = datetime.datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    # Epoch milliseconds keep filenames in time order without a strftime call
     rid = uuid.uuid4().hex[:8]
-    path = LOG_DIR / f"{stamp}_{kind}_{rid}.json"
+    path = LOG_DIR / f"{int(time.time() * 1000)}_{kind}_{rid}.json"
     record = {
         "id": rid,
         "kind": kind,
         "timestamp": _now_iso(),
         "payload": payload,
     }
-    _save_json(path, record)
+    _ensure_log_writer()
+    _LOG_QUEUE.put((path, record))
+
+
+_STAGE1_RE = re.compile(r"stage1")
 
 
 def _load_stage1_notes() -> list:
@@ -95,25 +271,26 @@ def _load_stage1_notes() -> list:
     Load Stage 1 notes from 00_INBOX and current_project.
     This assumes five sources: Perplexity, Groq, Grok, Claude, DeepSeek.
     """
-    candidates = []
+    # One scandir pass per base (file type comes from the directory entry, no
+    # extra stat), names matched against a precompiled pattern; a set keeps
+    # entries unique from the start
+    candidates = set()
     for base in [INBOX_DIR, PROJECT_ROOT]:
-        if not base.exists():
+        if not base.is_dir():
             continue
-        for p in base.glob("stage1_*.*"):
-            candidates.append(p)
-        for p in base.glob("stage1*.json"):
-            candidates.append(p)
-        for p in base.glob("stage1*.md"):
-            candidates.append(p)
+        with os.scandir(base) as entries:
+            for entry in entries:
+                if _STAGE1_RE.match(entry.name) and entry.is_file():
+                    candidates.add(entry.path)
 
     notes = []
-    for path in sorted(set(candidates)):
-        content = _read_text(path, "")
+    for path in sorted(candidates):
+        content = _read_text(Path(path), "")
         if not content.strip():
             continue
         notes.append(
             {
-                "source_path": str(path),
+                "source_path": path,
                 "content": content,
             }
         )
@@ -122,14 +299,92 @@ def _load_stage1_notes() -> list:
 
 
 # -----------------------------------------------------------------------------
-# Mermaid artifacts
+# LLM response cache
 # -----------------------------------------------------------------------------
 
-def _build_mermaid_overview() -> str:
+# Bump when the cached response format or prompt-building changes in a way
+# that should invalidate existing _meta/_cache entries.
+_LLM_CACHE_VERSION = 1
+
+
+def _llm_cache_path(agent_fn, instructions: str, temperature: float, max_tokens: int) -> Path:
     """
-    Mermaid diagram of the 6-stage pipeline with clear handoffs.
+    Location of the cached response for one (backend, agent, prompt, sampling)
+    combination. Sync and async runners (run_x / arun_x) share entries.
     """
-    return """```
+    from cog_nexus import MODEL_BACKEND
+
+    agent_name = agent_fn.__name__
+    if agent_name.startswith("arun_"):
+        agent_name = agent_name[1:]
+    key = hashlib.sha256(
+        "\x00".join(
+            (str(_LLM_CACHE_VERSION), MODEL_BACKEND, agent_name, instructions, str(temperature), str(max_tokens))
+        ).encode("utf-8")
+    ).hexdigest()
+    return LLM_CACHE_DIR / f"{key}.json"
+
+
+def _read_llm_cache(path: Path):
+    try:
+        return _loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None  # missing or unreadable entry: treat as a miss
+
+
+def _store_llm_cache(path: Path, response: dict) -> None:
+    # Only cache answers the stages can use; an unparseable response would
+    # otherwise be replayed on every later run instead of being retried.
+    try:
+        _parse_llm_json(response["text"])
+    except _LLM_PARSE_ERRORS:
+        return
+    _save_json(path, response)
+
+
+def _cached_llm(agent_fn, task_id: str, instructions: str, temperature: float, max_tokens: int) -> dict:
+    """
+    Call a cog_nexus runner, reusing the on-disk response if this exact prompt
+    was already answered by the same backend. Stage prompts are built
+    deterministically from their inputs, so unchanged Stage 1 notes skip the
+    model call entirely.
+    """
+    path = _llm_cache_path(agent_fn, instructions, temperature, max_tokens)
+    response = _read_llm_cache(path)
+    if response is None:
+        response = agent_fn(
+            task_id=task_id,
+            instructions=instructions,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        _store_llm_cache(path, response)
+    return response
+
+
+async def _acached_llm(agent_fn, task_id: str, instructions: str, temperature: float, max_tokens: int) -> dict:
+    """
+    Async variant of _cached_llm for the arun_* runners.
+    """
+    path = _llm_cache_path(agent_fn, instructions, temperature, max_tokens)
+    response = _read_llm_cache(path)
+    if response is None:
+        response = await agent_fn(
+            task_id=task_id,
+            instructions=instructions,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        _store_llm_cache(path, response)
+    return response
+
+
+# -----------------------------------------------------------------------------
+# Mermaid artifacts
+# -----------------------------------------------------------------------------
+
+# Mermaid diagram of the 6-stage pipeline with clear handoffs.
+_MERMAID_OVERVIEW = """```
 flowchart TD
     S1[Stage 1: Source Notes (Perplexity, Groq, Grok, Claude, DeepSeek)]
     S2[Stage 2: Extract & Normalize Ideas]
@@ -146,12 +401,8 @@ flowchart TD
     S6 -->|stage2_handoff.json| OUT[Downstream Systems]
 ```"""
 
-
-def _build_mermaid_agents() -> str:
-    """
-    Mermaid diagram of agents: monitor, clean, pack, plus main pipeline.
-    """
-    return """```
+# Mermaid diagram of agents: monitor, clean, pack, plus main pipeline.
+_MERMAID_AGENTS = """```
 flowchart LR
     subgraph Pipeline
         P2[Stage 2: Extractor]
@@ -185,57 +436,105 @@ flowchart LR
 ```"""
 
 
+def _build_mermaid_overview() -> str:
+    """
+    Mermaid diagram of the 6-stage pipeline with clear handoffs.
+    """
+    return _MERMAID_OVERVIEW
+
+
+def _build_mermaid_agents() -> str:
+    """
+    Mermaid diagram of agents: monitor, clean, pack, plus main pipeline.
+    """
+    return _MERMAID_AGENTS
+
+
 # -----------------------------------------------------------------------------
 # Stage 2: Extract & normalize ideas
 # -----------------------------------------------------------------------------
 
-def stage2_extract_unique_ideas(stage1_notes: list) -> dict:
+# Stage 2 runs as map-reduce: one small extraction call per Stage 1 note
+# (fanned out concurrently in the async path), then one merge/dedupe call
+# over the per-note results. Each call only sees its own note, instead of a
+# single prompt holding all notes at once.
+
+_STAGE2_SCHEMA = (
+    "Return strict JSON with this schema:\n"
+    "{\n"
+    '  "clusters": [\n'
+    '    {\n'
+    '      "name": "STAGES",\n'
+    '      "items": [\n'
+    '        {\n'
+    '          "id": "I-001",\n'
+    '          "summary": "6 stages with clear handoffs",\n'
+    '          "sources": ["Perplexity", "Claude"]\n'
+    "        }\n"
+    "      ]\n"
+    "    }\n"
+    "  ]\n"
+    "}\n\n"
+)
+
+
+def _stage2_map_prompt(idx: int, note: dict) -> tuple:
     """
-    Use an analyzer agent to extract every unique idea, number, or bullet
-    from all 5 Stage 1 notes and normalize them into a deduplicated set.
+    Build the task id and extraction prompt for a single Stage 1 note.
     """
-    task_id = _new_task_id(stage=2, seq=1)
+    task_id = _new_task_id(stage=2, seq=idx)
     prompt = (
-        "You are Stage 2 of a multi-LLM synthesis pipeline.\n"
-        "You receive 5 short, partially overlapping notes describing a nested cog pipeline.\n"
+        "You are Stage 2 (extract step) of a multi-LLM synthesis pipeline.\n"
+        "You receive ONE short note describing a nested cog pipeline.\n"
         "Your job is to:\n"
         "1) Extract every distinct idea, requirement, or numeric constraint.\n"
         "2) Normalize wording while preserving meaning.\n"
-        "3) Deduplicate overlapping bullets.\n"
-        "4) Organize output into labeled clusters (e.g., STAGES, TRACKING, PATHS, AGENTS, FILES, MISC).\n"
-        "5) For each bullet, assign a stable key like I-001, I-002, etc.\n\n"
-        "Return strict JSON with this schema:\n"
-        "{\n"
-        '  "clusters": [\n'
-        '    {\n'
-        '      "name": "STAGES",\n'
-        '      "items": [\n'
-        '        {\n'
-        '          "id": "I-001",\n'
-        '          "summary": "6 stages with clear handoffs",\n'
-        '          "sources": ["Perplexity", "Claude"]\n'
-        "        }\n"
-        "      ]\n"
-        "    }\n"
-        "  ]\n"
-        "}\n\n"
-        "Input notes:\n"
+        "3) Organize output into labeled clusters (e.g., STAGES, TRACKING, PATHS, AGENTS, FILES, MISC).\n"
+        "4) List the note's source in each item's sources.\n\n"
+        + _STAGE2_SCHEMA
+        + f"--- NOTE {idx} ({note['source_path']}) ---\n"
+        + note["content"][:12000]
     )
+    return task_id, prompt
 
-    for idx, note in enumerate(stage1_notes, start=1):
-        prompt += f"\n--- NOTE {idx} ({note['source_path']}) ---\n"
-        prompt += note["content"][:12000]
 
-    response = run_analyzer(
-        task_id=task_id,
-        instructions=prompt,
-        temperature=0.1,
-        max_tokens=2000,
+def _stage2_map_result(note: dict, response: dict) -> dict:
+    """
+    Parse one extraction response into {"source_path", "clusters"}.
+    """
+    try:
+        clusters = _parse_llm_json(response["text"]).get("clusters", [])
+    except _LLM_PARSE_ERRORS:
+        clusters = []
+    return {"source_path": note["source_path"], "clusters": clusters}
+
+
+def _stage2_merge_prompt(maps: list) -> tuple:
+    """
+    Build the task id and merge/dedupe prompt over the per-note extractions.
+    """
+    task_id = _new_task_id(stage=2, seq=len(maps) + 1)
+    prompt = (
+        "You are Stage 2 (merge step) of a multi-LLM synthesis pipeline.\n"
+        "You receive ideas already extracted separately from each of the Stage 1 notes.\n"
+        "Your job is to:\n"
+        "1) Merge them into one set of labeled clusters.\n"
+        "2) Deduplicate overlapping items, combining their sources.\n"
+        "3) For each item, assign a stable key like I-001, I-002, etc.\n\n"
+        + _STAGE2_SCHEMA
+        + "Per-note extractions JSON:\n"
+        + _dumps(maps).decode("utf-8")
     )
+    return task_id, prompt
 
+
+def _stage2_finish(task_id: str, response: dict) -> dict:
+    """
+    Parse the Stage 2 merge response and persist stage2_unique_ideas.json.
+    """
     try:
-        data = json.loads(response["text"])
-    except Exception:
+        data = _parse_llm_json(response["text"])
+    except _LLM_PARSE_ERRORS:
         data = {"clusters": []}
 
     out_path = PROJECT_ROOT / "stage2_unique_ideas.json"
@@ -248,13 +547,56 @@ def stage2_extract_unique_ideas(stage1_notes: list) -> dict:
     return data
 
 
+def stage2_extract_unique_ideas(stage1_notes: list) -> dict:
+    """
+    Use an analyzer agent to extract every unique idea, number, or bullet
+    from all 5 Stage 1 notes and normalize them into a deduplicated set.
+    """
+    from cog_nexus import run_analyzer
+
+    def _extract_one(idx: int, note: dict) -> dict:
+        map_id, map_prompt = _stage2_map_prompt(idx, note)
+        response = _cached_llm(run_analyzer, map_id, map_prompt, temperature=0.1, max_tokens=2000)
+        return _stage2_map_result(note, response)
+
+    # Per-note calls are independent and I/O-bound, so they overlap on a
+    # thread pool; results keep note order
+    with ThreadPoolExecutor(max_workers=min(8, len(stage1_notes) or 1)) as executor:
+        maps = list(executor.map(_extract_one, range(1, len(stage1_notes) + 1), stage1_notes))
+
+    task_id, prompt = _stage2_merge_prompt(maps)
+    response = _cached_llm(run_analyzer, task_id, prompt, temperature=0.1, max_tokens=2000)
+    return _stage2_finish(task_id, response)
+
+
+async def astage2_extract_unique_ideas(stage1_notes: list) -> dict:
+    """
+    Async variant of stage2_extract_unique_ideas; the per-note extraction
+    calls run concurrently.
+    """
+    from cog_nexus import arun_analyzer
+
+    async def _extract_one(idx: int, note: dict) -> dict:
+        map_id, map_prompt = _stage2_map_prompt(idx, note)
+        response = await _acached_llm(arun_analyzer, map_id, map_prompt, temperature=0.1, max_tokens=2000)
+        return _stage2_map_result(note, response)
+
+    maps = await asyncio.gather(
+        *[_extract_one(idx, note) for idx, note in enumerate(stage1_notes, start=1)]
+    )
+
+    task_id, prompt = _stage2_merge_prompt(list(maps))
+    response = await _acached_llm(arun_analyzer, task_id, prompt, temperature=0.1, max_tokens=2000)
+    return _stage2_finish(task_id, response)
+
+
 # -----------------------------------------------------------------------------
 # Stage 3: Synthesis & master plan
 # -----------------------------------------------------------------------------
 
-def stage3_build_master_plan(unique_ideas: dict) -> dict:
+def _stage3_prompt(unique_ideas: dict) -> tuple:
     """
-    Merge unique ideas into a single, detailed master plan for nesting_cog_omega.
+    Build the Stage 3 planner task id and prompt from the Stage 2 ideas.
     """
     task_id = _new_task_id(stage=3, seq=1)
     prompt = (
@@ -309,49 +651,65 @@ def stage3_build_master_plan(unique_ideas: dict) -> dict:
         "Unique ideas JSON:\n"
     )
 
-    prompt += json.dumps(unique_ideas, indent=2, ensure_ascii=False)[:14000]
+    prompt += _dumps(unique_ideas).decode("utf-8")[:14000]
+    return task_id, prompt
 
-    response = run_planner(
-        task_id=task_id,
-        instructions=prompt,
-        temperature=0.15,
-        max_tokens=2400,
-    )
 
+# Markdown layout of one master-plan stage; the stage schema is fixed, so
+# each stage renders with a single format call
+_STAGE_TMPL = (
+    "### Stage {index}: {name}\n\n"
+    "**Goal:** {goal}\n\n"
+    "**Inputs:**\n{inputs}\n"
+    "**Outputs:**\n{outputs}\n"
+    "**Agents:**\n{agents}\n"
+    "**Steps:**\n{steps}\n"
+)
+
+
+def _md_bullets(items: list) -> str:
+    return "".join(f"- {item}\n" for item in items)
+
+
+def _stage3_finish(task_id: str, response: dict) -> dict:
+    """
+    Parse the Stage 3 planner response and persist the master plan (JSON + markdown).
+    """
     try:
-        data = json.loads(response["text"])
-    except Exception:
+        data = _parse_llm_json(response["text"])
+    except _LLM_PARSE_ERRORS:
         data = {"stages": [], "agents": {}, "files": [], "tracking": {}}
 
     out_json = PROJECT_ROOT / "stage3_master_plan.json"
     _save_json(out_json, data)
 
-    # Render markdown version with Mermaid diagrams
-    md = ["# nesting_cog_omega Master Plan\n", "## Overview\n", _build_mermaid_overview(), "\n"]
-    md.append("## Agents\n")
-    md.append(_build_mermaid_agents())
-    md.append("\n")
-
-    md.append("## Stages\n")
+    # Render markdown version with Mermaid diagrams. Every fragment carries its
+    # own line breaks, so the buffer is written out as-is (no join separator).
+    buf = io.StringIO()
+    buf.write("# nesting_cog_omega Master Plan\n\n")
+    buf.write("## Overview\n\n")
+    buf.write(_MERMAID_OVERVIEW)
+    buf.write("\n\n")
+    buf.write("## Agents\n\n")
+    buf.write(_MERMAID_AGENTS)
+    buf.write("\n\n")
+
+    buf.write("## Stages\n\n")
     for st in data.get("stages", []):
-        md.append(f"### Stage {st.get('index')}: {st.get('name')}\n")
-        md.append(f"**Goal:** {st.get('goal')}\n\n")
-        md.append("**Inputs:**\n")
-        for item in st.get("inputs", []):
-            md.append(f"- {item}\n")
-        md.append("\n**Outputs:**\n")
-        for item in st.get("outputs", []):
-            md.append(f"- {item}\n")
-        md.append("\n**Agents:**\n")
-        for item in st.get("agents", []):
-            md.append(f"- {item}\n")
-        md.append("\n**Steps:**\n")
-        for step in st.get("steps", []):
-            md.append(f"- {step}\n")
-        md.append("\n")
+        buf.write(
+            _STAGE_TMPL.format(
+                index=st.get("index"),
+                name=st.get("name"),
+                goal=st.get("goal"),
+                inputs=_md_bullets(st.get("inputs", [])),
+                outputs=_md_bullets(st.get("outputs", [])),
+                agents=_md_bullets(st.get("agents", [])),
+                steps=_md_bullets(st.get("steps", [])),
+            )
+        )
 
     md_path = PROJECT_ROOT / "stage3_master_plan.md"
-    _write_text(md_path, "\n".join(md))
+    _write_text(md_path, buf.getvalue())
 
     _log_event(
         "stage3_build_master_plan",
@@ -360,6 +718,28 @@ def stage3_build_master_plan(unique_ideas: dict) -> dict:
     return data
 
 
+def stage3_build_master_plan(unique_ideas: dict) -> dict:
+    """
+    Merge unique ideas into a single, detailed master plan for nesting_cog_omega.
+    """
+    from cog_nexus import run_planner
+
+    task_id, prompt = _stage3_prompt(unique_ideas)
+    response = _cached_llm(run_planner, task_id, prompt, temperature=0.15, max_tokens=2400)
+    return _stage3_finish(task_id, response)
+
+
+async def astage3_build_master_plan(unique_ideas: dict) -> dict:
+    """
+    Async variant of stage3_build_master_plan.
+    """
+    from cog_nexus import arun_planner
+
+    task_id, prompt = _stage3_prompt(unique_ideas)
+    response = await _acached_llm(arun_planner, task_id, prompt, temperature=0.15, max_tokens=2400)
+    return _stage3_finish(task_id, response)
+
+
 # -----------------------------------------------------------------------------
 # Stage 4: Task planning & tracking
 # -----------------------------------------------------------------------------
@@ -370,6 +750,7 @@ def stage4_create_tasks(master_plan: dict) -> list:
     """
     task_id = _new_task_id(stage=4, seq=1)
     tasks = []
+    now = _now_iso()  # all tasks from one pass share a creation time
 
     for stage in master_plan.get("stages", []):
         s_idx = stage.get("index", 0)
@@ -384,7 +765,7 @@ def stage4_create_tasks(master_plan: dict) -> list:
                     "step_index": i,
                     "step": step,
                     "status": "pending",
-                    "created_at": _now_iso(),
+                    "created_at": now,
                 }
             )
 
@@ -409,13 +790,9 @@ def agent_monitor(tasks: list) -> dict:
     task_id = _new_task_id(stage=5, seq=0)
     summary = {
         "total_tasks": len(tasks),
-        "by_stage": {},
+        "by_stage": dict(Counter(str(t.get("stage")) for t in tasks)),
         "created_at": _now_iso(),
     }
-    for t in tasks:
-        s = str(t.get("stage"))
-        summary["by_stage"].setdefault(s, 0)
-        summary["by_stage"][s] += 1
 
     out_path = META_DIR / "monitor_summary.json"
     _save_json(out_path, summary)
@@ -427,6 +804,13 @@ def agent_monitor(tasks: list) -> dict:
     return summary
 
 
+def _try_load_json(path: Path) -> tuple:
+    try:
+        return path, _load_json(path, None)
+    except Exception:
+        return path, None
+
+
 def agent_clean() -> dict:
     """
     Clean and normalize intermediate outputs, ensuring consistent JSON and markdown.
@@ -434,15 +818,15 @@ def agent_clean() -> dict:
     task_id = _new_task_id(stage=5, seq=1)
     cleaned = {"normalized": [], "timestamp": _now_iso()}
 
-    # Example: ensure all JSON files under current_project are valid
-    for p in PROJECT_ROOT.rglob("*.json"):
-        try:
-            data = _load_json(p, None)
+    # Example: ensure all JSON files under current_project are valid.
+    # Reads + parses are independent, so they run on a small thread pool.
+    # The LLM response cache is internal state, not a pipeline artifact.
+    paths = [p for p in PROJECT_ROOT.rglob("*.json") if LLM_CACHE_DIR not in p.parents]
+    with ThreadPoolExecutor(max_workers=min(8, len(paths) or 1)) as executor:
+        for p, data in executor.map(_try_load_json, paths):
             if data is None:
                 continue
             cleaned["normalized"].append(str(p))
-        except Exception:
-            continue
 
     out_path = META_DIR / "clean_report.json"
     _save_json(out_path, cleaned)
@@ -469,16 +853,11 @@ def agent_pack(tasks: list, master_plan: dict, monitor_state: dict) -> dict:
         "tasks": tasks,
         "master_plan": master_plan,
         "monitor": monitor_state,
-        "artifacts": {
-            "unique_ideas": str(PROJECT_ROOT / "stage2_unique_ideas.json"),
-            "master_plan_json": str(PROJECT_ROOT / "stage3_master_plan.json"),
-            "master_plan_md": str(PROJECT_ROOT / "stage3_master_plan.md"),
-            "tasks_json": str(PROJECT_ROOT / "stage4_tasks.json"),
-            "monitor_json": str(META_DIR / "monitor_summary.json"),
-            "clean_report_json": str(META_DIR / "clean_report.json"),
-        },
+        "artifacts": dict(_ARTIFACT_PATHS),
     }
 
+    # The handoff (full plan + task list) is the largest document written;
+    # _save_json encodes it with orjson when available, straight to bytes
     _save_json(STAGE2_HANDOFF_PATH, handoff)
 
     _log_event(
@@ -514,9 +893,9 @@ def stage5_implementation_stub(tasks: list) -> None:
 # Stage 6: Review & finalize
 # -----------------------------------------------------------------------------
 
-def stage6_review_and_finalize(tasks: list, master_plan: dict) -> None:
+def _stage6_prompt(tasks: list, master_plan: dict) -> tuple:
     """
-    Use reviewer tools to cross-check master plan, tasks, and artifacts.
+    Build the Stage 6 reviewer task id and prompt from the tasks and master plan.
     """
     task_id = _new_task_id(stage=6, seq=2)
     checklist = {
@@ -528,7 +907,11 @@ def stage6_review_and_finalize(tasks: list, master_plan: dict) -> None:
             "Do Mermaid diagrams exist and renderable as markdown fences?",
             "Is stage2_handoff.json present and well-formed?",
         ],
-        "tasks_sample": tasks[:10],
+        # created_at changes on every run; leaving it out keeps the prompt
+        # (and so its _meta/_cache entry) stable for unchanged inputs
+        "tasks_sample": [
+            {k: v for k, v in t.items() if k != "created_at"} for t in tasks[:10]
+        ],
         "master_plan_head": master_plan.get("stages", [])[:3],
     }
 
@@ -537,19 +920,18 @@ def stage6_review_and_finalize(tasks: list, master_plan: dict) -> None:
         "You receive a master plan, tasks, and a checklist.\n"
         "Return a short JSON review with 'status' (ok|warn|fail) and 'notes' list.\n\n"
         "Checklist and samples:\n"
-        + json.dumps(checklist, indent=2, ensure_ascii=False)
+        + _dumps(checklist).decode("utf-8")
     )
+    return task_id, prompt
 
-    response = run_reviewer(
-        task_id=task_id,
-        instructions=prompt,
-        temperature=0.0,
-        max_tokens=800,
-    )
 
+def _stage6_finish(task_id: str, response: dict) -> None:
+    """
+    Parse the Stage 6 reviewer response and persist stage6_review.json.
+    """
     try:
-        review_data = json.loads(response["text"])
-    except Exception:
+        review_data = _parse_llm_json(response["text"])
+    except _LLM_PARSE_ERRORS:
         review_data = {"status": "warn", "notes": ["Reviewer output not parseable."]}
 
     out_path = META_DIR / "stage6_review.json"
@@ -561,13 +943,82 @@ def stage6_review_and_finalize(tasks: list, master_plan: dict) -> None:
     )
 
 
+def stage6_review_and_finalize(tasks: list, master_plan: dict) -> None:
+    """
+    Use reviewer tools to cross-check master plan, tasks, and artifacts.
+    """
+    from cog_nexus import run_reviewer
+
+    task_id, prompt = _stage6_prompt(tasks, master_plan)
+    response = _cached_llm(run_reviewer, task_id, prompt, temperature=0.0, max_tokens=800)
+    _stage6_finish(task_id, response)
+
+
+async def astage6_review_and_finalize(tasks: list, master_plan: dict) -> None:
+    """
+    Async variant of stage6_review_and_finalize.
+    """
+    from cog_nexus import arun_reviewer
+
+    task_id, prompt = _stage6_prompt(tasks, master_plan)
+    response = await _acached_llm(arun_reviewer, task_id, prompt, temperature=0.0, max_tokens=800)
+    _stage6_finish(task_id, response)
+
+
 # -----------------------------------------------------------------------------
 # Orchestration
 # -----------------------------------------------------------------------------
 
+async def arun_stage2_synthesizer() -> dict:
+    """
+    Async entrypoint: load Stage 1 notes, synthesize, and emit stage2_handoff.json.
+
+    Stages 2 -> 3 -> 4 depend on each other and run in sequence. Once tasks
+    exist, the monitor, Stage 5 stub and Stage 6 review are independent and
+    run concurrently. The clean agent only does local file I/O over the
+    project JSON, so it runs after those writers (and queued logs) finish;
+    the packer runs last.
+    """
+    api_keys = get_api_keys()
+    _log_event("keys_loaded", {"keys_present": list(api_keys.keys())})
+
+    # Stage 1: implicit, notes are already created by upstream systems.
+    stage1_notes = _load_stage1_notes()
+    _log_event("stage1_loaded", {"note_count": len(stage1_notes)})
+
+    # Stage 2: extract unique ideas
+    unique_ideas = await astage2_extract_unique_ideas(stage1_notes)
+
+    # Stage 3: master plan
+    master_plan = await astage3_build_master_plan(unique_ideas)
+
+    # Stage 4: tasks
+    tasks = stage4_create_tasks(master_plan)
+
+    # Monitor, Stage 5 stub, and Stage 6 review in parallel
+    monitor_state, _, _ = await asyncio.gather(
+        asyncio.to_thread(agent_monitor, tasks),
+        asyncio.to_thread(stage5_implementation_stub, tasks),
+        astage6_review_and_finalize(tasks, master_plan),
+    )
+
+    # Clean once every artifact and log written so far is on disk
+    await asyncio.to_thread(_flush_log_events)
+    agent_clean()
+
+    # Stage 6: pack
+    handoff = agent_pack(tasks, master_plan, monitor_state)
+
+    return handoff
+
+
 def run_stage2_synthesizer() -> dict:
     """
     Main entrypoint: load Stage 1 notes, synthesize, and emit stage2_handoff.json.
+
+    Synchronous, so it is safe to call from code that already runs an event
+    loop (e.g. notebooks). Stages run in the same order as in
+    arun_stage2_synthesizer(), but one at a time.
     """
     api_keys = get_api_keys()
     _log_event("keys_loaded", {"keys_present": list(api_keys.keys())})
@@ -585,20 +1036,23 @@ def run_stage2_synthesizer() -> dict:
     # Stage 4: tasks
     tasks = stage4_create_tasks(master_plan)
 
-    # Monitor
+    # Monitor, Stage 5 stub, and Stage 6 review
     monitor_state = agent_monitor(tasks)
-
-    # Stage 5: implementation stub + clean
     stage5_implementation_stub(tasks)
+    stage6_review_and_finalize(tasks, master_plan)
+
+    # Clean once every artifact and log written so far is on disk
+    _flush_log_events()
     agent_clean()
 
-    # Stage 6: review and pack
-    stage6_review_and_finalize(tasks, master_plan)
+    # Stage 6: pack
     handoff = agent_pack(tasks, master_plan, monitor_state)
 
+    _flush_log_events()
     return handoff
 
 
 if __name__ == "__main__":
-    result = run_stage2_synthesizer()
-    print(json.dumps({"stage2_handoff": str(STAGE2_HANDOFF_PATH)}, indent=2))
+    result = asyncio.run(arun_stage2_synthesizer())
+    _flush_log_events()
+    print(_dumps({"stage2_handoff": str(STAGE2_HANDOFF_PATH)}).decode("utf-8"))
@@ -9,7 +9,6 @@ This script demonstrates how to:
 """
 
 import json
-import subprocess
 import sys
 from pathlib import Path
 
@@ -200,6 +199,197 @@ def verify_outputs():
     return all_exist
 
 
+def test_call_model_override():
+    """Test that replacing cog_nexus._call_model reaches every runner path."""
+    print("\n" + "=" * 70)
+    print("TEST 7: Testing _call_model override...")
+    print("=" * 70)
+    
+    try:
+        import asyncio
+        from unittest import mock
+        import cog_nexus
+        
+        # A README-style replacement: no default handling of its own
+        def replacement(agent_type, task_id, instructions, temperature, max_tokens):
+            return {"text": "patched", "model": "patched-model", "sampling": (temperature, max_tokens)}
+        
+        with mock.patch("cog_nexus._call_model", side_effect=replacement):
+            results = {
+                "run_analyzer": cog_nexus.run_analyzer("test-override-1", "x"),
+                "batch_run_agents": cog_nexus.batch_run_agents([{"agent_type": "planner"}])[0],
+                "arun_reviewer": asyncio.run(cog_nexus.arun_reviewer("test-override-2", "x")),
+            }
+            sync_reviewer = cog_nexus.run_reviewer("test-override-3", "x")
+        
+        ok = True
+        for name, result in results.items():
+            if result.get("model") == "patched-model":
+                print(f"✓ {name} uses the replaced _call_model")
+            else:
+                print(f"✗ {name} bypassed the replaced _call_model")
+                ok = False
+        
+        if results["arun_reviewer"]["sampling"] == sync_reviewer["sampling"] == (0.0, 800):
+            print("✓ arun_reviewer sends the same defaults as run_reviewer")
+        else:
+            print(f"✗ arun_reviewer sent {results['arun_reviewer']['sampling']!r}")
+            ok = False
+        return ok
+    except Exception as e:
+        print(f"✗ Error testing _call_model override: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_llm_cache():
+    """Test LLM response cache hits, misses, and skipped writes."""
+    print("\n" + "=" * 70)
+    print("TEST 8: Testing LLM response cache...")
+    print("=" * 70)
+    
+    try:
+        import tempfile
+        from unittest import mock
+        import cog_nexus
+        import nesting_cog_omega
+        
+        calls = []
+        
+        def run_fake(task_id, instructions, temperature, max_tokens):
+            calls.append(task_id)
+            text = "not json" if instructions.startswith("bad") else '{"ok": true}'
+            return {"text": text, "task_id": task_id}
+        
+        def cached(instructions):
+            return nesting_cog_omega._cached_llm(run_fake, "test-cache", instructions, 0.0, 100)
+        
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(nesting_cog_omega, "LLM_CACHE_DIR", Path(tmp)):
+            checks = []
+            cached("good prompt")
+            cached("good prompt")
+            checks.append(("repeated prompt is served from cache", len(calls) == 1))
+            cached("bad prompt")
+            cached("bad prompt")
+            checks.append(("unparseable response is not cached", len(calls) == 3))
+            with mock.patch.object(cog_nexus, "MODEL_BACKEND", "other-model"):
+                cached("good prompt")
+            checks.append(("different backend misses the cache", len(calls) == 4))
+        
+        ok = True
+        for desc, passed in checks:
+            print(f"{'✓' if passed else '✗'} {desc}")
+            ok = ok and passed
+        return ok
+    except Exception as e:
+        print(f"✗ Error testing LLM cache: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_parse_llm_json():
+    """Test JSON recovery from fenced, prose-wrapped, truncated, and nested-only LLM output."""
+    print("\n" + "=" * 70)
+    print("TEST 9: Testing LLM JSON parsing...")
+    print("=" * 70)
+    
+    try:
+        from nesting_cog_omega import _parse_llm_json
+        
+        cases = [
+            ("fenced", 'Result:\n```json\n{"status": "ok"}\n```', {"status": "ok"}),
+            ("prose-wrapped", 'Sure! {"status": "ok", "notes": []} Hope that helps.', {"status": "ok", "notes": []}),
+            ("malformed then valid", '{"a": 1,} and then {"b": 2}', {"b": 2}),
+            ("stray brace in prose", 'Fields {a) ... {"status": "ok"}', {"status": "ok"}),
+            ("unclosed prose brace", 'Output keys {stages, agents: {"status": "ok"}', {"status": "ok"}),
+            ("stray brace then truncated", 'Fields {a) then {"status": "fail", "notes": [{"id": 1}', None),
+            ("truncated", '{"stages": [{"index": 0, "name": "n0"}, {"index": 1, "na', None),
+            ("truncated review", '{"status": "fail", "notes": [{"id": 1}], "more": [', None),
+            ("nested-only", '{"stages": [{"index": 1}], }', None),
+            ("unbalanced braces", "{" * 20000, None),
+        ]
+        
+        ok = True
+        for desc, text, expected in cases:
+            try:
+                result = _parse_llm_json(text)
+            except ValueError:
+                result = None
+            if result == expected:
+                print(f"✓ {desc}")
+            else:
+                print(f"✗ {desc}: got {result!r}, expected {expected!r}")
+                ok = False
+        return ok
+    except Exception as e:
+        print(f"✗ Error testing LLM JSON parsing: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_cached_rerun():
+    """Test that re-running on unchanged Stage 1 notes makes no model calls."""
+    print("\n" + "=" * 70)
+    print("TEST 10: Testing cached pipeline re-run...")
+    print("=" * 70)
+    
+    try:
+        import asyncio
+        import itertools
+        from unittest import mock
+        import cog_nexus
+        import nesting_cog_omega
+        
+        calls = []
+        
+        # Planner returns real stages so Stage 4 produces (timestamped) tasks
+        def replacement(agent_type, task_id, instructions, temperature, max_tokens):
+            calls.append(agent_type)
+            if agent_type == "planner":
+                text = '{"stages": [{"index": 1, "name": "S1", "goal": "g", "steps": ["a", "b"]}]}'
+            else:
+                text = '{"status": "ok", "clusters": [], "notes": []}'
+            return {"text": text, "model": "test-rerun-model", "task_id": task_id}
+        
+        # Distinct timestamps per call, as if each run happened at a later time
+        stamps = (f"2000-01-01T00:00:{n:02d}Z" for n in itertools.count())
+        
+        with mock.patch("cog_nexus._call_model", side_effect=replacement), \
+                mock.patch.object(cog_nexus, "MODEL_BACKEND", "test-rerun-model"), \
+                mock.patch.object(nesting_cog_omega, "_now_iso", side_effect=lambda: next(stamps)):
+            nesting_cog_omega.run_stage2_synthesizer()
+            calls.clear()
+            nesting_cog_omega.run_stage2_synthesizer()
+            sync_calls = list(calls)
+            asyncio.run(nesting_cog_omega.arun_stage2_synthesizer())
+            async_calls = calls[len(sync_calls):]
+        
+        report = json.loads(Path("projects/current_project/_meta/clean_report.json").read_text())
+        cache_dir = str(nesting_cog_omega.LLM_CACHE_DIR)
+        checks = [
+            ("sync re-run makes no model calls", sync_calls == []),
+            ("async re-run makes no model calls", async_calls == []),
+            ("clean report skips the LLM cache", not any(p.startswith(cache_dir) for p in report["normalized"])),
+        ]
+        
+        ok = True
+        for desc, passed in checks:
+            print(f"{'✓' if passed else '✗'} {desc}")
+            ok = ok and passed
+        if not ok:
+            print(f"  model calls: sync={sync_calls}, async={async_calls}")
+        return ok
+    except Exception as e:
+        print(f"✗ Error testing cached re-run: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def main():
     """Run all tests."""
     print("\n")
@@ -216,6 +406,10 @@ def main():
         ("Stage 1 notes", test_stage1_notes),
         ("Orchestrator dry-run", test_orchestrator_dry_run),
         ("Output artifacts", verify_outputs),
+        ("_call_model override", test_call_model_override),
+        ("LLM response cache", test_llm_cache),
+        ("LLM JSON parsing", test_parse_llm_json),
+        ("Cached pipeline re-run", test_cached_rerun),
     ]
     
     results = []